@@ -1,5 +1,6 @@
 import os
 import json
+from collections import OrderedDict
 from typing import List, Dict, Any
 from supabase import create_client, Client
 from openai import OpenAI
@@ -8,6 +9,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class Memory:
+    # Max distinct texts kept in the embedding cache
+    EMBEDDING_CACHE_SIZE = 4096
+
     def __init__(self):
         # Initialize Supabase
         url = os.environ.get("SUPABASE_URL")
@@ -22,12 +26,30 @@ class Memory:
             raise ValueError("OPENAI_API_KEY missing in .env")
         self.openai = OpenAI(api_key=openai_key)
 
+        # Embedding cache: identical texts (repeated queries, the duplicate
+        # check in add_memory re-embedding the same question) skip the
+        # OpenAI round trip. Bounded LRU so memory stays flat.
+        self._embedding_cache: OrderedDict = OrderedDict()
+
     def get_embedding(self, text: str) -> List[float]:
         """Convert text to a vector using OpenAI with error handling."""
         try:
             text = text.replace("\n", " ")
+
+            cached = self._embedding_cache.get(text)
+            if cached is not None:
+                self._embedding_cache.move_to_end(text)
+                return list(cached)
+
             response = self.openai.embeddings.create(input=[text], model="text-embedding-3-small")
-            return response.data[0].embedding
+            embedding = response.data[0].embedding
+
+            # Stored as a tuple so cached vectors can't be mutated in place
+            self._embedding_cache[text] = tuple(embedding)
+            if len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+
+            return embedding
         except Exception as e:
             print(f"⚠️  OpenAI embedding error: {str(e)}")
             raise RuntimeError(f"Failed to generate embedding: {str(e)}")
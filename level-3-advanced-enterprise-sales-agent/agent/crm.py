@@ -5,7 +5,7 @@ Prepares data for CRM export and handoff.
 """
 
 import os
-import json
+import orjson
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from dotenv import load_dotenv
@@ -236,7 +236,8 @@ class CRMHandler:
             # Could analyze sentiment here
         elif engagement_type == "voice":
             transcript = engagement_data.get("result", {}).get("transcript", [])
-            content = json.dumps(transcript, indent=2)
+            # Keep indentation here: transcripts are stored for human review in the CRM
+            content = orjson.dumps(transcript, option=orjson.OPT_INDENT_2).decode()
             # Extract sentiment if available
             sentiment_score = engagement_data.get("sentiment_score")
         
@@ -259,6 +260,95 @@ class CRMHandler:
         
         return False
     
+    def bulk_save_engagement_results(self, leads: List[Dict[str, Any]]) -> int:
+        """
+        Save engagement results for many leads with batched queries.
+
+        Instead of one lookup + one INSERT + one UPDATE per lead, this
+        resolves missing lead IDs with a single lookup, inserts every
+        interaction in one statement, and batches the status updates.
+
+        Args:
+            leads: Lead dictionaries; only those with an engagement_result
+                   entry are processed
+
+        Returns:
+            Number of interactions saved
+        """
+        engaged = [lead for lead in leads if lead.get("engagement_result")]
+        if not engaged:
+            return 0
+
+        try:
+            # Resolve missing lead IDs with one lookup by company name
+            missing = [lead for lead in engaged if not lead.get("id")]
+            if missing:
+                names = [lead.get("company_name") for lead in missing]
+                response = self.supabase.table("leads").select("id, company_name").in_(
+                    "company_name", names
+                ).execute()
+                by_name = {row["company_name"]: row["id"] for row in (response.data or [])}
+
+                for lead in missing:
+                    lead_id = by_name.get(lead.get("company_name"))
+                    if not lead_id:
+                        # Lead not in the database yet - create it
+                        lead_id = self.save_lead(lead)
+                    if lead_id:
+                        lead["id"] = lead_id
+
+            # Build all interaction rows up front
+            rows = []
+            status_updates = {"engaged": [], "qualified": []}
+            for lead in engaged:
+                lead_id = lead.get("id")
+                if not lead_id:
+                    continue
+
+                engagement_type = lead["engagement_result"].get("type")
+                engagement_data = lead["engagement_result"].get("data", {})
+
+                if engagement_type == "email":
+                    content = engagement_data.get("body", "")
+                    sentiment_score = None
+                    status_updates["qualified"].append(lead_id)
+                elif engagement_type == "voice":
+                    transcript = engagement_data.get("result", {}).get("transcript", [])
+                    content = orjson.dumps(transcript, option=orjson.OPT_INDENT_2).decode()
+                    sentiment_score = engagement_data.get("sentiment_score")
+                    status_updates["engaged"].append(lead_id)
+                else:
+                    continue
+
+                rows.append({
+                    "lead_id": lead_id,
+                    "type": engagement_type,
+                    "direction": "outbound",
+                    "content": content,
+                    "sentiment_score": sentiment_score
+                })
+
+            if not rows:
+                return 0
+
+            # Single bulk INSERT for every interaction
+            response = self.supabase.table("interactions").insert(rows).execute()
+            saved_count = len(response.data) if response.data else 0
+
+            # One UPDATE per target status instead of one per lead
+            for new_status, lead_ids in status_updates.items():
+                if lead_ids:
+                    self.supabase.table("leads").update({"status": new_status}).in_(
+                        "id", lead_ids
+                    ).execute()
+
+            console.print(f"[green]✅ Bulk saved {saved_count} engagement results[/green]")
+            return saved_count
+
+        except Exception as e:
+            console.print(f"[red]❌ Error bulk saving engagement results: {e}[/red]")
+            return 0
+
     def get_lead_summary(self, lead_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a complete summary of a lead including contacts and interactions.
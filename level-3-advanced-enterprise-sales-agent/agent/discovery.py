@@ -1,6 +1,7 @@
 import os
-import json
+import orjson
 import time
+import threading
 from typing import List, Dict, Any
 from groq import Groq
 from dotenv import load_dotenv
@@ -8,6 +9,35 @@ from tools.search_tool import SearchTool
 
 load_dotenv()
 
+
+class _TokenBucket:
+    """
+    Threadsafe token-bucket rate limiter for outbound API calls.
+    Only sleeps when the bucket is actually empty, so bursts within the
+    allowed rate go through with zero added latency (unlike a fixed sleep).
+    """
+
+    def __init__(self, max_rate: float = 5.0, time_period: float = 1.0):
+        self.capacity = max_rate
+        self.refill_rate = max_rate / time_period
+        self.tokens = max_rate
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.refill_rate
+            time.sleep(wait)
+
+
 class DiscoveryEngine:
     """
     Phase 2: Lead Discovery Engine.
@@ -26,6 +56,9 @@ class DiscoveryEngine:
             print(f"⚠️  Warning: Search tool initialization failed: {e}")
             self.search_tool = None
 
+        # Rate limiter for search API politeness (replaces fixed sleeps)
+        self.rate_limiter = _TokenBucket(max_rate=5.0, time_period=1.0)
+
     def find_leads(self, icp_profile: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Main entry point: Finds leads matching the ICP.
@@ -55,11 +88,12 @@ class DiscoveryEngine:
         # Step 2: Execute Searches (Limit to top 3 queries to save rate limits)
         for query in queries[:3]:
             print(f"   🌐 Searching Web: '{query}'...")
+            # Token bucket only blocks when we exceed the allowed rate,
+            # so consecutive searches under the limit add no wall time.
+            self.rate_limiter.acquire()
             results = self._execute_search(query)
             if results:
                 all_raw_results.extend(results)
-            # Brief pause to be polite to APIs
-            time.sleep(1)
             
         if not all_raw_results:
             print("❌ No search results found.")
@@ -80,7 +114,7 @@ class DiscoveryEngine:
         You are a Lead Generation Researcher. Generate 3-5 specific Google search queries to find companies matching this Ideal Customer Profile (ICP).
         
         ICP Profile:
-        {json.dumps(icp, indent=2)}
+        {orjson.dumps(icp).decode()}
         
         Strategy:
         1. Look for "top companies" lists in the specific vertical.
@@ -135,7 +169,7 @@ class DiscoveryEngine:
         prompt = f"""
         You are a Lead Data Extractor. Analyze the search results below and extract a list of distinct companies that match the target ICP.
         
-        Target ICP: {json.dumps(icp)}
+        Target ICP: {orjson.dumps(icp).decode()}
         
         Search Results:
         {formatted_results}
@@ -204,8 +238,8 @@ class DiscoveryEngine:
             elif "```" in text:
                 text = text.split("```")[1].split("```")[0]
                 
-            return json.loads(text.strip())
-        except json.JSONDecodeError:
+            return orjson.loads(text.strip())
+        except orjson.JSONDecodeError:
             print(f"   ⚠️  JSON parse error. Raw text: {text[:50]}...")
             return []
         except Exception as e:
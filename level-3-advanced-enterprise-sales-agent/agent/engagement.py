@@ -4,7 +4,8 @@ Handles outbound communication with leads via email and voice calls.
 """
 
 import os
-import json
+import orjson
+from collections import deque
 from typing import Dict, Any, List, Optional
 from groq import Groq
 from dotenv import load_dotenv
@@ -184,26 +185,47 @@ class EngagementEngine:
         console.print(Panel(script, title="Call Script", border_style="cyan"))
         
         # Define conversation handler
-        conversation_history = [{"role": "system", "content": f"Lead: {lead.get('company_name')}, Industry: {lead.get('industry')}"}]
-        
+        # Bounded history: a live call must not grow memory (or prompt size)
+        # without limit, so older turns are folded into a one-line summary
+        # as they fall off the deque.
+        max_history_turns = 10
+        conversation_history = deque(maxlen=max_history_turns)
+        dropped_turn_summaries = []
+        user_turn_count = 0
+        max_user_turns = 10
+
         def handle_user_speech(user_text: str) -> str:
             """Handle user speech and generate agent response."""
+            nonlocal user_turn_count
+
             if not user_text:
                 return script  # Initial greeting
-            
-            # Add user message to history
+
+            # Early-exit safeguard: never let a live call loop past the cap
+            user_turn_count += 1
+            if user_turn_count > max_user_turns:
+                return "Thanks so much for your time today. I'll follow up over email with next steps. Goodbye!"
+
+            # Add user message to history, summarizing the turn that falls off
+            if len(conversation_history) == max_history_turns:
+                oldest = conversation_history[0]
+                dropped_turn_summaries.append(f"{oldest['role']}: {oldest['content'][:80]}")
             conversation_history.append({"role": "user", "content": user_text})
-            
+
+            earlier_context = "; ".join(dropped_turn_summaries[-5:]) or "None"
+
             # Generate response using LLM
             prompt = f"""
             You are a professional sales representative on a call with a potential client.
-            
+
             Lead: {lead.get('company_name')}
             Industry: {lead.get('industry')}
-            
-            Conversation so far:
-            {json.dumps(conversation_history[-5:], indent=2)}
-            
+
+            Earlier in the call (summary): {earlier_context}
+
+            Recent conversation:
+            {orjson.dumps(list(conversation_history)[-5:]).decode()}
+
             Generate a natural, helpful response (2-3 sentences max). Be conversational, not scripted.
             """
             
@@ -218,6 +240,9 @@ class EngagementEngine:
                 )
                 
                 agent_response = response.choices[0].message.content.strip()
+                if len(conversation_history) == max_history_turns:
+                    oldest = conversation_history[0]
+                    dropped_turn_summaries.append(f"{oldest['role']}: {oldest['content'][:80]}")
                 conversation_history.append({"role": "assistant", "content": agent_response})
                 return agent_response
             except Exception as e:
@@ -318,8 +343,8 @@ class EngagementEngine:
             elif "```" in text:
                 text = text.split("```")[1].split("```")[0]
             
-            return json.loads(text.strip())
-        except json.JSONDecodeError:
+            return orjson.loads(text.strip())
+        except orjson.JSONDecodeError:
             console.print(f"[yellow]⚠️  JSON parse error. Using fallback.[/yellow]")
             return {}
         except Exception as e:
@@ -1,5 +1,5 @@
 import os
-import json
+import orjson
 from groq import Groq
 from rich.prompt import Prompt
 
@@ -30,7 +30,7 @@ class ICPBuilder:
         prompt = f"""
         Convert these interview answers into a structured JSON Ideal Customer Profile.
         
-        Answers: {json.dumps(answers)}
+        Answers: {orjson.dumps(answers).decode()}
         
         Output JSON with keys: industry, size_range, decision_maker, pain_points, keywords.
         
@@ -83,12 +83,12 @@ class ICPBuilder:
             
             if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
                 json_text = text[start_idx:end_idx + 1]
-                return json.loads(json_text)
+                return orjson.loads(json_text)
             else:
                 # Try parsing the whole text
-                return json.loads(text)
-                
-        except json.JSONDecodeError as e:
+                return orjson.loads(text)
+
+        except orjson.JSONDecodeError as e:
             print(f"   ⚠️  JSON parse error: {e}")
             print(f"   Raw text preview: {text[:100]}...")
             return {}
@@ -1,5 +1,8 @@
-import json
+import asyncio
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from enum import Enum
 from rich.console import Console
 from agent.icp_builder import ICPBuilder
 from agent.discovery import DiscoveryEngine
@@ -9,13 +12,25 @@ from agent.crm import CRMHandler
 
 console = Console()
 
+
+class Phase(str, Enum):
+    """Campaign phases. str-valued so state stays JSON/log friendly."""
+    INIT = "INIT"
+    DISCOVERY = "DISCOVERY"
+    QUALIFICATION = "QUALIFICATION"
+    ENGAGEMENT = "ENGAGEMENT"
+    CRM = "CRM"
+    DONE = "DONE"
+
+
 class SalesOrchestrator:
     def __init__(self):
         self.state = {
             "icp_profile": None,
             "leads": [],
             "qualified_leads": [],
-            "current_phase": "INIT"
+            "top_leads": [],
+            "current_phase": Phase.INIT
         }
         self.icp_builder = ICPBuilder()
         self.discovery = DiscoveryEngine()
@@ -23,24 +38,36 @@ class SalesOrchestrator:
         self.engagement = EngagementEngine()
         self.crm = CRMHandler()
 
+        # Dispatch table: phase name -> handler. Adding a phase is one entry
+        # here instead of another elif branch in the loop.
+        self._phase_handlers = {
+            Phase.INIT: self._handle_init,
+            Phase.DISCOVERY: self._handle_discovery,
+            Phase.QUALIFICATION: self._handle_qualification,
+            Phase.ENGAGEMENT: self._handle_engagement,
+            Phase.CRM: self._handle_crm,
+        }
+
     def run_cli(self):
         """Main interaction loop."""
-        while True:
-            if self.state["current_phase"] == "INIT":
-                self._handle_init()
-            elif self.state["current_phase"] == "DISCOVERY":
-                self._handle_discovery()
-            elif self.state["current_phase"] == "QUALIFICATION":
-                self._handle_qualification()
-            elif self.state["current_phase"] == "ENGAGEMENT":
-                self._handle_engagement()
-            elif self.state["current_phase"] == "CRM":
-                self._handle_crm()
-            
-            # Simple exit condition for demo
-            if self.state["current_phase"] == "DONE":
-                console.print("[green]✅ Campaign Setup Complete![/green]")
-                break
+        while self.state["current_phase"] != Phase.DONE:
+            self._phase_handlers[self.state["current_phase"]]()
+
+        console.print("[green]✅ Campaign Setup Complete![/green]")
+
+    async def run_cli_async(self):
+        """
+        Async entry point for embedding the CLI in an event loop.
+
+        Phase handlers block on console input and network I/O, so each one
+        runs in a worker thread; the surrounding event loop stays responsive
+        between phases instead of being stalled by console.input.
+        """
+        while self.state["current_phase"] != Phase.DONE:
+            handler = self._phase_handlers[self.state["current_phase"]]
+            await asyncio.to_thread(handler)
+
+        console.print("[green]✅ Campaign Setup Complete![/green]")
 
     def _handle_init(self):
         console.print("[bold blue]Phase 1: ICP Definition[/bold blue]")
@@ -56,7 +83,7 @@ class SalesOrchestrator:
                 "size": "50-200"
             }
         
-        self.state["current_phase"] = "DISCOVERY"
+        self.state["current_phase"] = Phase.DISCOVERY
 
     def _handle_discovery(self):
         console.print("\n[bold blue]Phase 2: Lead Discovery[/bold blue]")
@@ -67,29 +94,38 @@ class SalesOrchestrator:
         self.state["leads"] = leads
         
         console.print(f"✅ Found {len(leads)} potential leads.")
-        self.state["current_phase"] = "QUALIFICATION"
+        self.state["current_phase"] = Phase.QUALIFICATION
 
     def _handle_qualification(self):
         console.print("\n[bold blue]Phase 3: Automated Qualification[/bold blue]")
         
         qualified = []
-        for lead in self.state["leads"]:
-            score = self.qualifier.score_lead(lead, self.state["icp_profile"])
+        scores = self.qualifier.score_leads(self.state["leads"], self.state["icp_profile"])
+        score_lines = []
+        for lead, score in zip(self.state["leads"], scores):
             lead["score"] = score
-            console.print(f"   • {lead['company_name']}: Score {score}/100")
-            
+            score_lines.append(f"   • {lead['company_name']}: Score {score}/100")
+
             # Only qualify leads with score >= 50
             if score >= 50:
                 qualified.append(lead)
+
+        # One print/flush for the whole scoreboard instead of one per lead
+        if score_lines:
+            console.print("\n".join(score_lines))
         
+        # Sort once by score so engagement always works best-first, and
+        # compute the demo slice here instead of re-slicing in each handler
+        qualified.sort(key=lambda lead: lead["score"], reverse=True)
         self.state["qualified_leads"] = qualified
+        self.state["top_leads"] = qualified[:5]
         console.print(f"\n[green]✅ {len(qualified)} leads qualified for outreach[/green]")
         
         if qualified:
-            self.state["current_phase"] = "ENGAGEMENT"
+            self.state["current_phase"] = Phase.ENGAGEMENT
         else:
             # Skip to CRM if no qualified leads
-            self.state["current_phase"] = "CRM"
+            self.state["current_phase"] = Phase.CRM
     
     def _handle_engagement(self):
         """Phase 4: Engagement - Email and Voice Outreach"""
@@ -97,7 +133,7 @@ class SalesOrchestrator:
         
         if not self.state["qualified_leads"]:
             console.print("[yellow]No qualified leads to engage[/yellow]")
-            self.state["current_phase"] = "DONE"
+            self.state["current_phase"] = Phase.DONE
             return
         
         # Ask user for engagement preference
@@ -116,14 +152,22 @@ class SalesOrchestrator:
             console.print("[yellow]Skipping engagement phase[/yellow]")
         
         # Move to CRM phase after engagement
-        self.state["current_phase"] = "CRM"
+        self.state["current_phase"] = Phase.CRM
     
     def _handle_email_engagement(self):
         """Generate and send emails to qualified leads."""
         console.print("\n[cyan]📧 Generating personalized emails...[/cyan]")
-        
-        for lead in self.state["qualified_leads"][:5]:  # Limit to 5 for demo
-            email = self.engagement.generate_email(lead, self.state["icp_profile"])
+
+        # Generation is I/O-bound LLM calls, so draft all emails concurrently
+        # up front; the interactive review/send loop below stays sequential.
+        leads = self.state["top_leads"]  # Highest-scoring leads, capped for demo
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            emails = list(executor.map(
+                lambda lead: self.engagement.generate_email(lead, self.state["icp_profile"]),
+                leads
+            ))
+
+        for lead, email in zip(leads, emails):
             console.print(f"\n[bold]Email for {lead['company_name']}:[/bold]")
             console.print(f"   Subject: {email.get('subject')}")
             console.print(f"   Preview: {email.get('body', '')[:100]}...")
@@ -150,13 +194,14 @@ class SalesOrchestrator:
         
         # Select lead for call
         console.print("\n[bold]Select a lead to call:[/bold]")
-        for i, lead in enumerate(self.state["qualified_leads"][:5], 1):
+        top_leads = self.state["top_leads"]
+        for i, lead in enumerate(top_leads, 1):
             console.print(f"   {i}. {lead['company_name']} (Score: {lead.get('score', 0)})")
-        
+
         try:
             selection = int(console.input("\n[bold]Enter number (1-5):[/bold] "))
-            if 1 <= selection <= min(5, len(self.state["qualified_leads"])):
-                selected_lead = self.state["qualified_leads"][selection - 1]
+            if 1 <= selection <= len(top_leads):
+                selected_lead = top_leads[selection - 1]
                 
                 # Ask for call type
                 call_type = console.input("Call type - Interactive (i) or Script-only (s): ")
@@ -210,7 +255,7 @@ class SalesOrchestrator:
         else:
             console.print("[yellow]Skipping CRM handoff[/yellow]")
         
-        self.state["current_phase"] = "DONE"
+        self.state["current_phase"] = Phase.DONE
     
     def _save_leads_to_crm(self):
         """Save all discovered leads to CRM database."""
@@ -238,16 +283,9 @@ class SalesOrchestrator:
             console.print("[yellow]No qualified leads with engagement data[/yellow]")
             return
         
-        saved_count = 0
-        for lead in self.state["qualified_leads"]:
-            # Check if lead has engagement data
-            if lead.get("engagement_result"):
-                engagement_type = lead["engagement_result"].get("type")
-                engagement_data = lead["engagement_result"].get("data", {})
-                
-                if self.crm.save_engagement_result(lead, engagement_type, engagement_data):
-                    saved_count += 1
-        
+        # Bulk path: one lookup, one INSERT and batched status updates
+        # instead of three round-trips per lead
+        saved_count = self.crm.bulk_save_engagement_results(self.state["qualified_leads"])
         console.print(f"[green]✅ Saved {saved_count} engagement results[/green]")
     
     def _export_crm_data(self):
@@ -261,11 +299,11 @@ class SalesOrchestrator:
         export_data = self.crm.export_crm_data(status_filter=status_filter)
         
         if export_data:
-            # Save to file
-            import json
+            # Save to file (orjson serializes in one C pass, no Python-level
+            # encoder loop; OPT_INDENT_2 keeps the export human-readable)
             filename = f"crm_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, "w") as f:
-                json.dump(export_data, f, indent=2)
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
             
             console.print(f"[green]✅ CRM data exported to: {filename}[/green]")
             console.print(f"   • {export_data['total_leads']} leads")
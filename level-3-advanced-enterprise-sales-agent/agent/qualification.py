@@ -1,31 +1,78 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedICP:
+    """
+    ICP fields pre-normalized for scoring. Built once per profile so the
+    per-lead hot path never lowercases or re-reads the raw dict; slots keep
+    the instance to two pointers with no per-instance __dict__.
+    """
+    industry_lower: str
+    size: str
+
+    @classmethod
+    def from_profile(cls, icp):
+        return cls(industry_lower=icp['industry'].lower(), size=icp['size'])
+
+
 class QualificationSystem:
+    # Intent signals that count toward the score. A frozenset makes the
+    # per-lead check a constant-time set operation and gives one place to
+    # grow the signal vocabulary.
+    INTENT_SIGNALS = frozenset({"hiring"})
+
     def __init__(self):
         self.frameworks = {
             "BANT": ["Budget", "Authority", "Need", "Timeline"],
             "MEDDIC": ["Metrics", "Economic Buyer", "Decision Criteria", "Decision Process", "Identify Pain", "Champion"]
         }
+        # Normalized-ICP memo: the same ICP is scored against every lead,
+        # so its lowercased fields are computed once, not per call.
+        self._icp_norm_cache = {}
+
+    def _normalize_icp(self, icp):
+        """Returns a NormalizedICP for a profile, cached per ICP values."""
+        key = (icp['industry'], icp['size'])
+        cached = self._icp_norm_cache.get(key)
+        if cached is None:
+            cached = NormalizedICP.from_profile(icp)
+            self._icp_norm_cache[key] = cached
+        return cached
+
+    def score_leads(self, leads, icp):
+        """
+        Scores a whole batch of leads in one pass.
+        ICP normalization is hoisted out of the loop so per-lead work is
+        just the membership checks.
+        """
+        norm_icp = self._normalize_icp(icp)
+        return [self._score(lead, norm_icp) for lead in leads]
 
     def score_lead(self, lead, icp):
         """
         Calculates a 0-100 fit score based on data availability and ICP match.
         """
+        return self._score(lead, self._normalize_icp(icp))
+
+    def _score(self, lead, norm_icp):
         score = 0
-        
+
         # 1. Industry Fit (30 pts)
-        if icp['industry'].lower() in lead['industry'].lower():
+        if norm_icp.industry_lower in lead['industry'].lower():
             score += 30
-            
+
         # 2. Size Fit (20 pts)
         # (Simplified string matching for demo)
-        if icp['size'] in lead.get('employee_count', ''):
+        if norm_icp.size in lead.get('employee_count', ''):
             score += 20
-            
+
         # 3. Data Richness (20 pts)
         if lead.get('website') and lead.get('description'):
             score += 20
-            
+
         # 4. Intent Signals (Mocked) (30 pts)
-        if "hiring" in lead.get('signals', []):
+        if not self.INTENT_SIGNALS.isdisjoint(lead.get('signals', ())):
             score += 30
-            
-        return score
\ No newline at end of file
+
+        return score
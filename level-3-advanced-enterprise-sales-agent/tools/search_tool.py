@@ -4,6 +4,11 @@ Provides web search capabilities for lead discovery and research.
 """
 
 import os
+import threading
+import orjson
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
@@ -16,6 +21,38 @@ except ImportError:
 
 load_dotenv()
 
+# Process-wide response cache shared by every SearchTool instance, persisted
+# to disk so reruns of the same campaign skip queries they already paid for.
+_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".search_cache.json")
+_CACHE_MAX_ENTRIES = 128
+_response_cache: OrderedDict = OrderedDict()
+_cache_lock = threading.Lock()
+_cache_loaded = False
+
+
+def _load_response_cache():
+    """Load the persisted response cache once per process."""
+    global _cache_loaded
+    if _cache_loaded:
+        return
+    _cache_loaded = True
+    try:
+        with open(_CACHE_PATH, "rb") as f:
+            _response_cache.update(orjson.loads(f.read()))
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"⚠️  Warning: could not load search cache: {e}")
+
+
+def _persist_response_cache():
+    """Write the response cache to disk (best effort)."""
+    try:
+        with open(_CACHE_PATH, "wb") as f:
+            f.write(orjson.dumps(_response_cache))
+    except Exception as e:
+        print(f"⚠️  Warning: could not persist search cache: {e}")
+
 
 class SearchTool:
     """
@@ -23,22 +60,30 @@ class SearchTool:
     Provides various search strategies for lead discovery and research.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, client: Optional["TavilyClient"] = None):
         """
         Initialize the search tool.
-        
+
         Args:
             api_key: Optional Tavily API key. If not provided, reads from TAVILY_API_KEY env var.
+            client: Optional pre-built TavilyClient. Inject one shared client
+                    when several tools run in the same process so they reuse
+                    a single HTTP connection pool instead of re-opening
+                    TLS connections per instance.
         """
         if not TAVILY_AVAILABLE:
             raise ImportError("tavily-python package is required. Install with: pip install tavily-python")
-        
+
         self.api_key = api_key or os.getenv("TAVILY_API_KEY")
-        if not self.api_key:
+        if client is None and not self.api_key:
             raise ValueError("TAVILY_API_KEY not found in environment variables")
-        
-        self.client = TavilyClient(api_key=self.api_key)
-    
+
+        self.client = client or TavilyClient(api_key=self.api_key)
+
+        # Warm the shared response cache from disk on first use
+        with _cache_lock:
+            _load_response_cache()
+
     def search(
         self,
         query: str,
@@ -60,22 +105,48 @@ class SearchTool:
         Returns:
             List of search result dictionaries with title, url, content, etc.
         """
+        # String key so the cache survives a JSON round-trip to disk
+        cache_key = repr((
+            query,
+            search_depth,
+            max_results,
+            tuple(include_domains) if include_domains else None,
+            tuple(exclude_domains) if exclude_domains else None
+        ))
+        with _cache_lock:
+            cached = _response_cache.get(cache_key)
+            if cached is not None:
+                _response_cache.move_to_end(cache_key)
+                # Hand out a copy: callers mutate result lists, and an
+                # aliased hit would poison the cache (and get persisted)
+                return orjson.loads(orjson.dumps(cached))
+
         try:
             search_params = {
                 "query": query,
                 "search_depth": search_depth,
                 "max_results": max_results
             }
-            
+
             if include_domains:
                 search_params["include_domains"] = include_domains
-            
+
             if exclude_domains:
                 search_params["exclude_domains"] = exclude_domains
-            
+
             response = self.client.search(**search_params)
-            return response.get("results", [])
-            
+            results = response.get("results", [])
+
+            with _cache_lock:
+                # Store a private copy for the same reason as the hit path:
+                # the caller keeps (and may mutate) the original list
+                _response_cache[cache_key] = orjson.loads(orjson.dumps(results))
+                while len(_response_cache) > _CACHE_MAX_ENTRIES:
+                    _response_cache.popitem(last=False)
+                _persist_response_cache()
+
+            return results
+
         except Exception as e:
             print(f"❌ Search failed for query '{query}': {str(e)}")
             return []
@@ -99,17 +170,13 @@ class SearchTool:
         Returns:
             List of search results
         """
-        # Build query
-        query_parts = [f"{industry} companies"]
-        
-        if location:
-            query_parts.append(f"in {location}")
-        
-        if company_size:
-            query_parts.append(company_size)
-        
-        query = " ".join(query_parts)
-        
+        # Build query in one pass: f-string plus a join over the optional
+        # parts avoids the append-then-join list dance.
+        query = f"{industry} companies"
+        optional = " ".join(filter(None, (f"in {location}" if location else None, company_size)))
+        if optional:
+            query = f"{query} {optional}"
+
         return self.search(
             query=query,
             search_depth="advanced",
@@ -133,15 +200,8 @@ class SearchTool:
         Returns:
             List of search results
         """
-        query_parts = [company_name]
-        
-        if job_title:
-            query_parts.append(job_title)
-        else:
-            query_parts.append("executives decision makers")
-        
-        query = " ".join(query_parts)
-        
+        query = f"{company_name} {job_title or 'executives decision makers'}"
+
         return self.search(
             query=query,
             search_depth="advanced",
@@ -165,15 +225,8 @@ class SearchTool:
         Returns:
             List of search results
         """
-        query_parts = [industry]
-        
-        if topic:
-            query_parts.append(topic)
-        else:
-            query_parts.append("trends news 2024")
-        
-        query = " ".join(query_parts)
-        
+        query = f"{industry} {topic or 'trends news 2024'}"
+
         return self.search(
             query=query,
             search_depth="basic",  # Basic is sufficient for news/trends
@@ -245,13 +298,8 @@ class SearchTool:
         Returns:
             List of search results
         """
-        query_parts = [f"{company_name} competitors"]
-        
-        if industry:
-            query_parts.append(industry)
-        
-        query = " ".join(query_parts)
-        
+        query = f"{company_name} competitors {industry}" if industry else f"{company_name} competitors"
+
         return self.search(
             query=query,
             search_depth="advanced",
@@ -275,16 +323,25 @@ class SearchTool:
         Returns:
             Dictionary mapping queries to their results
         """
-        results = {}
-        
-        for query in queries:
-            results[query] = self.search(
-                query=query,
-                search_depth=search_depth,
-                max_results=max_results_per_query
+        if not queries:
+            return {}
+
+        # Drop duplicate queries before dispatch (order-preserving); the
+        # result dict is keyed by query, so duplicates were pure waste.
+        unique_queries = list(dict.fromkeys(queries))
+
+        # Searches are independent network calls, so dispatch them
+        # concurrently; dict insertion order preserves the query order.
+        with ThreadPoolExecutor(max_workers=min(len(unique_queries), 8)) as executor:
+            result_lists = executor.map(
+                lambda query: self.search(
+                    query=query,
+                    search_depth=search_depth,
+                    max_results=max_results_per_query
+                ),
+                unique_queries
             )
-        
-        return results
+            return dict(zip(unique_queries, result_lists))
     
     def format_results(self, results: List[Dict[str, Any]], format_type: str = "summary") -> str:
         """
@@ -331,18 +388,23 @@ class SearchTool:
         Returns:
             List of URLs
         """
-        return [result.get("url") for result in results if result.get("url")]
+        # Generator + filter: one .get per result (the comprehension called
+        # it twice) and no per-element truthiness lambda.
+        return list(filter(None, map(itemgetter("url"), (
+            result for result in results if "url" in result
+        ))))
 
 
-def create_search_tool(api_key: Optional[str] = None) -> SearchTool:
+def create_search_tool(api_key: Optional[str] = None, client: Optional["TavilyClient"] = None) -> SearchTool:
     """
     Factory function to create a SearchTool instance.
-    
+
     Args:
         api_key: Optional API key
-        
+        client: Optional shared TavilyClient (see SearchTool.__init__)
+
     Returns:
         SearchTool instance
     """
-    return SearchTool(api_key=api_key)
+    return SearchTool(api_key=api_key, client=client)
 
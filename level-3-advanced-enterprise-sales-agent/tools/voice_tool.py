@@ -5,10 +5,18 @@ Handles audio streaming for real-time voice conversations.
 
 import os
 import io
+import asyncio
+import base64
+import json
+import logging
+import logging.handlers
 import queue
+import re
 import threading
 import time
-from typing import Optional, Callable, Generator
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional, Callable, Generator, Union
 from dotenv import load_dotenv
 
 try:
@@ -31,6 +39,7 @@ except OSError:
 # Try alternative audio libraries
 try:
     import sounddevice as sd
+    import numpy as np  # sounddevice ships with numpy; needed for int16 views
     SOUNDDEVICE_AVAILABLE = True
 except ImportError:
     SOUNDDEVICE_AVAILABLE = False
@@ -41,6 +50,44 @@ try:
 except ImportError:
     SIMPLEAUDIO_AVAILABLE = False
 
+# websocket-client (optional - for the ElevenLabs realtime TTS endpoint)
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    WEBSOCKET_AVAILABLE = False
+
+# miniaudio (optional - streaming MP3 decode; lets TTS keep the smaller MP3
+# network payload while playback still gets int16 PCM)
+try:
+    import miniaudio
+    MINIAUDIO_AVAILABLE = True
+
+    class _ChunkSource(miniaudio.StreamableSource):
+        """
+        File-like source feeding network chunks into miniaudio's streaming
+        decoder. One decoder lives for the whole response, so MP3 frame
+        boundaries survive arbitrary network chunking without rebuilding an
+        in-memory file per chunk.
+        """
+
+        def __init__(self, chunks: Iterable[bytes]):
+            self._chunks = iter(chunks)
+            self._buffer = bytearray()
+
+        def read(self, num_bytes: int) -> bytes:
+            while len(self._buffer) < num_bytes:
+                try:
+                    self._buffer.extend(next(self._chunks))
+                except StopIteration:
+                    break
+            data = bytes(self._buffer[:num_bytes])
+            del self._buffer[:num_bytes]
+            return data
+
+except ImportError:
+    MINIAUDIO_AVAILABLE = False
+
 # Deepgram (optional - for future STT integration)
 try:
     from deepgram import Deepgram
@@ -53,6 +100,55 @@ except (ImportError, Exception) as e:
 
 load_dotenv()
 
+# Call-loop logger: messages enqueue instantly and a background listener
+# thread does the terminal writes, so the thread driving audio playback
+# never blocks on stderr mid-turn.
+_log_queue: queue.Queue = queue.Queue(-1)
+_call_logger = logging.getLogger("voice_tool.call")
+if not _call_logger.handlers:
+    _call_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    _call_logger.setLevel(logging.INFO)
+    _call_logger.propagate = False
+    _log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+    _log_listener.start()
+
+
+class _RollingTranscriptBuffer:
+    """
+    LocalAgreement-style stabilizer for streaming STT (the whisper-streaming
+    trick): a word counts as confirmed once two consecutive interim
+    hypotheses agree on it, and confirmed words are emitted exactly once.
+    Callers can act on stable text mid-utterance instead of waiting for the
+    final transcript, and the confirmed prefix is trimmed from the rolling
+    hypothesis so comparisons stay short.
+    """
+
+    def __init__(self):
+        self._previous = []
+        self._confirmed_count = 0
+
+    def update(self, hypothesis: str) -> str:
+        """Feed the latest interim hypothesis; returns newly confirmed words."""
+        words = hypothesis.split()
+        agreed = 0
+        for prev_word, word in zip(self._previous, words):
+            if prev_word != word:
+                break
+            agreed += 1
+
+        newly_confirmed = words[self._confirmed_count:agreed]
+        if agreed > self._confirmed_count:
+            self._confirmed_count = agreed
+        self._previous = words
+        return " ".join(newly_confirmed)
+
+    def flush(self) -> str:
+        """Emit remaining unconfirmed words and reset (end of utterance)."""
+        remaining = self._previous[self._confirmed_count:]
+        self._previous = []
+        self._confirmed_count = 0
+        return " ".join(remaining)
+
 
 class VoiceTool:
     """
@@ -91,11 +187,39 @@ class VoiceTool:
         self.sample_rate = 44100
         self.channels = 1
         self.chunk_size = 1024
+
+        # Transport format: MP3 is ~10x smaller on the wire, so prefer it
+        # when miniaudio can decode it locally; otherwise ask ElevenLabs for
+        # raw PCM so playback never sees compressed bytes.
+        if MINIAUDIO_AVAILABLE:
+            self.output_format = "mp3_44100_128"
+        else:
+            self.output_format = f"pcm_{self.sample_rate}"
+
+        # ElevenLabs streaming-latency mode (0 = best quality ... 4 = lowest
+        # latency). Live calls care about time-to-first-audio, so default to
+        # the aggressive end; override per call or via env if quality matters.
+        self.optimize_streaming_latency = int(os.getenv("ELEVENLABS_STREAMING_LATENCY", "3"))
+
+        # Progressive playback write sizing: start with ~20ms writes so the
+        # first audio is audible immediately, then double up to ~200ms per
+        # write to cut per-write device overhead for the rest of the clip.
+        bytes_per_second = self.sample_rate * self.channels * 2  # int16
+        self._min_write_bytes = int(bytes_per_second * 0.02)
+        self._max_write_bytes = int(bytes_per_second * 0.20)
+        self._write_target = self._min_write_bytes
+        self._write_buffer = bytearray()
         
         # Audio I/O setup
         self.audio = None
         self.input_stream = None
         self.output_stream = None
+        self._sd_stream = None  # persistent sounddevice OutputStream
+
+        # TTS cache: repeated scripts (greetings, fallback lines) skip the
+        # ElevenLabs round-trip entirely. Bounded LRU to keep memory sane.
+        self._tts_cache: OrderedDict = OrderedDict()
+        self._tts_cache_max_entries = 32
         
         if PYAUDIO_AVAILABLE:
             try:
@@ -129,19 +253,29 @@ class VoiceTool:
                 except Exception as e:
                     print(f"⚠️  Deepgram initialization warning: {e}")
     
-    def text_to_speech_stream(self, text: str) -> Generator[bytes, None, None]:
+    def text_to_speech_stream(
+        self,
+        text: str,
+        optimize_streaming_latency: Optional[int] = None
+    ) -> Generator[bytes, None, None]:
         """
         Convert text to speech and stream audio chunks.
-        
+
         Args:
             text: Text to convert to speech
-            
+            optimize_streaming_latency: ElevenLabs latency/quality trade-off
+                (0 = best quality ... 4 = lowest latency). Defaults to the
+                tool-level setting.
+
         Yields:
             Audio chunks as bytes
         """
         if not ELEVENLABS_AVAILABLE:
             raise RuntimeError("ElevenLabs SDK not available")
-        
+
+        if optimize_streaming_latency is None:
+            optimize_streaming_latency = self.optimize_streaming_latency
+
         try:
             # Generate audio stream from ElevenLabs
             # Using the text_to_speech method with streaming
@@ -149,31 +283,134 @@ class VoiceTool:
                 voice_id=self.voice_id,
                 text=text,
                 model_id="eleven_turbo_v2_5",  # Fast model for real-time
-                voice_settings=self.voice_settings
+                voice_settings=self.voice_settings,
+                optimize_streaming_latency=optimize_streaming_latency,
+                output_format=self.output_format
             )
-            
+            if self.output_format.startswith("mp3"):
+                audio_generator = self._decode_mp3_stream(audio_generator)
+
             # Yield audio chunks
             for chunk in audio_generator:
                 if chunk:
                     yield chunk
-                    
+
         except Exception as e:
             print(f"❌ TTS Error: {e}")
             # Fallback: try alternative method
             try:
-                audio_generator = self.client.generate(
-                    text=text,
-                    voice=self.voice_id,
-                    model="eleven_turbo_v2_5",
-                    stream=True
-                )
+                if MINIAUDIO_AVAILABLE:
+                    # MP3 default is fine here: we decode it ourselves
+                    audio_generator = self.client.generate(
+                        text=text,
+                        voice=self.voice_id,
+                        model="eleven_turbo_v2_5",
+                        stream=True
+                    )
+                    audio_generator = self._decode_mp3_stream(audio_generator)
+                else:
+                    # No decoder available, so ask for raw PCM matching the
+                    # playback stream instead of the MP3 default
+                    audio_generator = self.client.generate(
+                        text=text,
+                        voice=self.voice_id,
+                        model="eleven_turbo_v2_5",
+                        output_format=f"pcm_{self.sample_rate}",
+                        stream=True
+                    )
                 for chunk in audio_generator:
                     if chunk:
                         yield chunk
             except Exception as e2:
                 print(f"❌ TTS Fallback Error: {e2}")
                 raise
-    
+
+    def _decode_mp3_stream(
+        self,
+        chunks: Iterable[bytes]
+    ) -> Generator[bytes, None, None]:
+        """
+        Decode an MP3 byte stream to int16 PCM incrementally.
+
+        The decoder persists across the whole stream (see _ChunkSource), so
+        frames split across network chunks decode cleanly and PCM comes out
+        as soon as whole frames arrive.
+        """
+        pcm_frames = miniaudio.stream_any(
+            source=_ChunkSource(chunks),
+            source_format=miniaudio.FileFormat.MP3,
+            output_format=miniaudio.SampleFormat.SIGNED16,
+            nchannels=self.channels,
+            sample_rate=self.sample_rate
+        )
+        for frames in pcm_frames:
+            yield frames.tobytes()
+
+    def text_to_speech_ws_stream(
+        self,
+        text_fragments: Union[str, Iterable[str]]
+    ) -> Generator[bytes, None, None]:
+        """
+        Stream text fragments to the ElevenLabs realtime WebSocket endpoint
+        and yield audio chunks as they arrive.
+
+        With auto_mode the server starts generating as soon as it has enough
+        input (word-level), instead of waiting for the full text like the
+        HTTP endpoint. Falls back to text_to_speech_stream when
+        websocket-client is not installed.
+
+        Args:
+            text_fragments: A string, or an iterable of text pieces (words,
+                phrases) to stream as they become available
+
+        Yields:
+            Audio chunks as bytes
+        """
+        if isinstance(text_fragments, str):
+            text_fragments = [text_fragments]
+
+        if not WEBSOCKET_AVAILABLE:
+            yield from self.text_to_speech_stream(" ".join(text_fragments))
+            return
+
+        # The realtime path always asks for raw PCM: it is latency-critical,
+        # so no decode step sits between the socket and the speakers.
+        url = (
+            f"wss://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}/stream-input"
+            f"?model_id=eleven_turbo_v2_5&auto_mode=true&output_format=pcm_{self.sample_rate}"
+        )
+        ws = websocket.create_connection(url, header={"xi-api-key": self.api_key})
+
+        def _send_text():
+            try:
+                # Opening frame carries the voice settings
+                ws.send(json.dumps({"text": " ", "voice_settings": self.voice_settings}))
+                for fragment in text_fragments:
+                    if fragment:
+                        ws.send(json.dumps({"text": fragment + " "}))
+                # Empty text ends the generation
+                ws.send(json.dumps({"text": ""}))
+            except Exception as e:
+                print(f"⚠️  WebSocket send error: {e}")
+
+        sender = threading.Thread(target=_send_text, daemon=True)
+        sender.start()
+
+        try:
+            while True:
+                message = ws.recv()
+                if not message:
+                    break
+                data = json.loads(message)
+                audio_b64 = data.get("audio")
+                if audio_b64:
+                    yield base64.b64decode(audio_b64)
+                if data.get("isFinal"):
+                    break
+        finally:
+            sender.join(timeout=5)
+            ws.close()
+
     def speak(self, text: str, play_audio: bool = True) -> bytes:
         """
         Convert text to speech and optionally play it.
@@ -185,41 +422,210 @@ class VoiceTool:
         Returns:
             Complete audio data as bytes
         """
-        audio_chunks = []
-        
-        # Collect all audio chunks
-        for chunk in self.text_to_speech_stream(text):
-            audio_chunks.append(chunk)
-            if play_audio and PYAUDIO_AVAILABLE:
-                self._play_audio_chunk(chunk)
-        
-        # Return complete audio
-        return b''.join(audio_chunks)
+        # Serve repeated scripts from cache (no API round-trip)
+        cache_key = (self.voice_id, text)
+        cached_audio = self._tts_cache.get(cache_key)
+        if cached_audio is not None:
+            self._tts_cache.move_to_end(cache_key)
+            if play_audio:
+                # memoryview slices replay the cached clip without copying
+                # a bytes object per chunk
+                audio_view = memoryview(cached_audio)
+                for i in range(0, len(cached_audio), self.chunk_size):
+                    self._play_audio_chunk(audio_view[i:i + self.chunk_size])
+                self.flush_playback()
+            return cached_audio
+
+        if play_audio and PYAUDIO_AVAILABLE:
+            audio_data = self._play_stream(self.text_to_speech_stream(text))
+        else:
+            audio_data = b''.join(self.text_to_speech_stream(text))
+
+        # Cache the synthesized audio, evicting least-recently-used entries
+        self._tts_cache[cache_key] = audio_data
+        while len(self._tts_cache) > self._tts_cache_max_entries:
+            self._tts_cache.popitem(last=False)
+
+        return audio_data
     
+    def _play_stream(self, chunks: Iterable[bytes], prebuffer_seconds: float = 0.5) -> bytes:
+        """
+        Pump TTS chunks through a bounded queue into a dedicated playback
+        thread (producer/consumer). Network jitter while fetching chunks no
+        longer starves the audio device directly, and the queue bound gives
+        backpressure instead of unbounded buffering.
+
+        Playback holds off until ~prebuffer_seconds of audio has arrived
+        (or the stream ends), so a slow start from the API does not cause
+        an immediate underrun after the first chunk.
+
+        Returns:
+            Complete audio data as bytes
+        """
+        buffer: queue.Queue = queue.Queue(maxsize=32)
+        prebuffer_bytes = int(self.sample_rate * self.channels * 2 * prebuffer_seconds)
+        prebuffered = threading.Event()
+
+        def consume():
+            prebuffered.wait()
+            while True:
+                chunk = buffer.get()
+                if chunk is None:
+                    break
+                self._play_audio_chunk(chunk)
+            self.flush_playback()
+
+        player = threading.Thread(target=consume, daemon=True)
+        player.start()
+
+        collected = []
+        buffered_bytes = 0
+        try:
+            for chunk in chunks:
+                collected.append(chunk)
+                buffered_bytes += len(chunk)
+                # Release the consumer once enough audio has arrived; also
+                # release if the queue fills first so the producer cannot
+                # block against a parked consumer.
+                if buffered_bytes >= prebuffer_bytes or buffer.full():
+                    prebuffered.set()
+                buffer.put(chunk)
+        finally:
+            buffer.put(None)  # Sentinel: end of stream
+            prebuffered.set()  # Short clips: play whatever arrived
+            player.join()
+
+        return b''.join(collected)
+
+    # Sentence boundary for the TTS pipeline
+    _SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+    def speak_pipelined(self, text: str, play_audio: bool = True, max_prefetch: int = 2) -> bytes:
+        """
+        Speak long text as a sentence-level pipeline.
+
+        While one sentence plays, the next sentences are already being
+        synthesized (at most max_prefetch in flight, bounded by the worker
+        pool). Playback strictly preserves sentence order, so this sounds
+        identical to speak() but hides most synthesis latency behind
+        playback of the preceding sentence.
+
+        Args:
+            text: Text to speak
+            play_audio: Whether to play audio through speakers
+            max_prefetch: Max TTS requests in flight at once
+
+        Returns:
+            Complete audio data as bytes
+        """
+        sentences = [s for s in self._SENTENCE_SPLIT.split(text.strip()) if s]
+        if len(sentences) <= 1:
+            return self.speak(text, play_audio=play_audio)
+
+        def synthesize(sentence: str) -> bytes:
+            # Route through speak() so each sentence hits (and populates)
+            # the TTS cache; repeated lines across a call cost no API trip
+            return self.speak(sentence, play_audio=False)
+
+        audio_parts = []
+        with ThreadPoolExecutor(max_workers=max_prefetch) as executor:
+            # Submit everything; the pool size caps in-flight API calls and
+            # iterating futures in submission order preserves sentence order.
+            futures = [executor.submit(synthesize, sentence) for sentence in sentences]
+            for future in futures:
+                audio_data = future.result()
+                audio_parts.append(audio_data)
+                if play_audio:
+                    audio_view = memoryview(audio_data)
+                    for i in range(0, len(audio_data), self.chunk_size):
+                        self._play_audio_chunk(audio_view[i:i + self.chunk_size])
+
+        if play_audio:
+            self.flush_playback()
+
+        return b''.join(audio_parts)
+
     def _play_audio_chunk(self, chunk: bytes):
-        """Play a single audio chunk through speakers."""
+        """
+        Queue a chunk for playback with progressive write sizing: the first
+        write is ~20ms of audio (fast start), each subsequent write doubles
+        up to ~200ms (low overhead). Call flush_playback() at end of clip.
+        """
+        self._write_buffer += chunk
+        while len(self._write_buffer) >= self._write_target:
+            # Hand the backend a zero-copy view into the reused buffer;
+            # the write is synchronous, so the view can be released and the
+            # consumed prefix dropped immediately afterwards.
+            view = memoryview(self._write_buffer)[:self._write_target]
+            try:
+                self._write_audio(view)
+            finally:
+                view.release()
+            del self._write_buffer[:self._write_target]
+            if self._write_target < self._max_write_bytes:
+                self._write_target = min(self._write_target * 2, self._max_write_bytes)
+
+    def flush_playback(self):
+        """Play any buffered audio and reset the progressive write size."""
+        if self._write_buffer:
+            view = memoryview(self._write_buffer)
+            try:
+                self._write_audio(view)
+            finally:
+                view.release()
+            self._write_buffer.clear()
+        self._write_target = self._min_write_bytes
+
+    def _ensure_output_stream(self):
+        """
+        Open the playback stream ahead of time so the first audible chunk
+        of an utterance never pays device-open latency. Safe to call
+        repeatedly; existing streams are reused.
+        """
+        if PYAUDIO_AVAILABLE and self.audio and not self.output_stream:
+            try:
+                self.output_stream = self.audio.open(
+                    format=pyaudio.paInt16,
+                    channels=self.channels,
+                    rate=self.sample_rate,
+                    output=True
+                )
+                return
+            except Exception as e:
+                print(f"⚠️  PyAudio stream open error: {e}")
+
+        if SOUNDDEVICE_AVAILABLE and self._sd_stream is None:
+            try:
+                self._sd_stream = sd.OutputStream(
+                    samplerate=self.sample_rate,
+                    channels=self.channels,
+                    dtype='int16'
+                )
+                self._sd_stream.start()
+            except Exception as e:
+                print(f"⚠️  SoundDevice stream open error: {e}")
+
+    def _write_audio(self, chunk: bytes):
+        """Write one block of audio to the first available backend."""
+        self._ensure_output_stream()
+
         # Try pyaudio first
-        if PYAUDIO_AVAILABLE and self.audio:
+        if PYAUDIO_AVAILABLE and self.audio and self.output_stream:
             try:
-                if not self.output_stream:
-                    self.output_stream = self.audio.open(
-                        format=pyaudio.paInt16,
-                        channels=self.channels,
-                        rate=self.sample_rate,
-                        output=True
-                    )
                 self.output_stream.write(chunk)
                 return
             except Exception as e:
                 print(f"⚠️  PyAudio playback error: {e}")
-        
-        # Try sounddevice as alternative
-        if SOUNDDEVICE_AVAILABLE:
+
+        # Try sounddevice as alternative: a persistent write-based
+        # OutputStream, not sd.play (which spawns a fresh playback per call
+        # and lets consecutive chunks overlap or gap)
+        if SOUNDDEVICE_AVAILABLE and self._sd_stream is not None:
             try:
-                import numpy as np
-                # Convert bytes to numpy array
+                # frombuffer is a zero-copy reinterpretation of the chunk's
+                # memory as int16; no per-chunk import or allocation here.
                 audio_array = np.frombuffer(chunk, dtype=np.int16)
-                sd.play(audio_array, samplerate=self.sample_rate)
+                self._sd_stream.write(audio_array)
                 return
             except Exception as e:
                 print(f"⚠️  SoundDevice playback error: {e}")
@@ -239,42 +645,84 @@ class VoiceTool:
     
     def start_listening(self, callback: Callable[[str], None], duration: int = 10):
         """
-        Start listening for speech input (placeholder for future STT integration).
-        
-        Note: ElevenLabs currently focuses on TTS. For STT, you'd integrate
-        with services like Deepgram, AssemblyAI, or Whisper.
-        
+        Listen on the microphone and stream audio to Deepgram live STT.
+
+        Mic audio is captured in chunk_size frames and forwarded to a
+        Deepgram live-transcription socket as it arrives; finalized
+        transcripts are delivered to the callback. Falls back to the mock
+        transcription when Deepgram or a microphone backend is unavailable.
+
         Args:
             callback: Function to call with transcribed text
             duration: How long to listen (seconds)
         """
-        # Placeholder implementation
-        if self.deepgram:
+        if self.deepgram and PYAUDIO_AVAILABLE and self.audio:
             try:
-                dg_connection = self.deepgram.transcription.live({
-                    'punctuate': True,
-                    'interim_results': False
-                })
-                # In production, integrate with a speech-to-text service
-                print("🎤 Listening for speech... (STT integration needed)")
-                
-                async def on_message(transcript):
-                    text = transcript['channel']['alternatives'][0]['transcript']
-                    if text:
-                        callback(text)
-                    
-                dg_connection.registerHandler('transcriptReceived', on_message)
-                time.sleep(1)
-                callback("Mock transcription - integrate STT service here")
+                asyncio.run(self._listen_live(callback, duration))
                 return
             except Exception as e:
                 print(f"⚠️  Deepgram error: {e}")
-        
-        # Fallback if Deepgram not available
+
+        # Fallback if Deepgram/microphone not available
         print("🎤 Listening for speech... (STT integration needed)")
         print("   Note: For full STT, integrate with Deepgram, AssemblyAI, or OpenAI Whisper")
         time.sleep(1)
         callback("Mock transcription - integrate STT service here")
+
+    async def _listen_live(self, callback: Callable[[str], None], duration: int):
+        """
+        Stream buffered mic audio to a Deepgram live socket.
+
+        Interim hypotheses run through a LocalAgreement stabilizer, so the
+        callback receives confirmed word fragments as they stabilize
+        mid-utterance rather than one blob at the end.
+        """
+        dg_connection = await self.deepgram.transcription.live({
+            'punctuate': True,
+            'interim_results': True,
+            'encoding': 'linear16',
+            'sample_rate': self.sample_rate,
+            'channels': self.channels,
+        })
+
+        stabilizer = _RollingTranscriptBuffer()
+
+        def on_transcript(transcript):
+            try:
+                text = transcript['channel']['alternatives'][0]['transcript']
+            except (KeyError, IndexError, TypeError):
+                return
+            if not text:
+                return
+            confirmed = stabilizer.update(text)
+            if transcript.get('is_final'):
+                # End of utterance: everything left is trustworthy now
+                tail = stabilizer.flush()
+                confirmed = " ".join(filter(None, (confirmed, tail)))
+            if confirmed:
+                callback(confirmed)
+
+        dg_connection.registerHandler('transcriptReceived', on_transcript)
+
+        mic = self.audio.open(
+            format=pyaudio.paInt16,
+            channels=self.channels,
+            rate=self.sample_rate,
+            input=True,
+            frames_per_buffer=self.chunk_size
+        )
+        try:
+            print("🎤 Listening for speech...")
+            deadline = time.monotonic() + duration
+            while time.monotonic() < deadline:
+                data = mic.read(self.chunk_size, exception_on_overflow=False)
+                dg_connection.send(data)
+                # Yield so transcript events are dispatched between reads
+                await asyncio.sleep(0)
+        finally:
+            mic.stop_stream()
+            mic.close()
+            await dg_connection.finish()
     
     def _handle_deepgram_transcription(self, dg_connection):
         """Handle Deepgram transcription."""
@@ -307,12 +755,17 @@ class VoiceTool:
         """
         transcript = []
         turn_count = 0
-        
-        print("📞 Starting voice call...")
-        
-        # Initial greeting
-        print(f"🤖 Agent: {script[:100]}...")
-        audio_data = self.speak(script, play_audio=True)
+        call_started = time.monotonic()
+
+        _call_logger.info("📞 Starting voice call...")
+
+        # Warm the playback stream before the first utterance
+        self._ensure_output_stream()
+
+        # Initial greeting (pipelined: later sentences synthesize while
+        # earlier ones play)
+        _call_logger.info("🤖 Agent: %.100s...", script)
+        audio_data = self.speak_pipelined(script, play_audio=True)
         transcript.append({"role": "agent", "text": script, "audio_length": len(audio_data)})
         
         # Conversation loop
@@ -342,14 +795,14 @@ class VoiceTool:
                 agent_response = f"I understand you said: {user_text}. How can I help you further?"
             
             # Speak response
-            print(f"🤖 Agent: {agent_response[:100]}...")
-            audio_data = self.speak(agent_response, play_audio=True)
+            _call_logger.info("🤖 Agent: %.100s...", agent_response)
+            audio_data = self.speak_pipelined(agent_response, play_audio=True)
             transcript.append({"role": "agent", "text": agent_response, "audio_length": len(audio_data)})
-        
-        print("📞 Call ended.")
-        
+
+        _call_logger.info("📞 Call ended.")
+
         return {
-            "duration_seconds": time.time(),  # Would track actual duration
+            "duration_seconds": time.monotonic() - call_started,
             "turns": turn_count,
             "transcript": transcript,
             "status": "completed"
@@ -363,6 +816,14 @@ class VoiceTool:
     
     def cleanup(self):
         """Clean up audio resources."""
+        if self._sd_stream:
+            try:
+                self._sd_stream.stop()
+                self._sd_stream.close()
+            except Exception as e:
+                print(f"⚠️  SoundDevice cleanup warning: {e}")
+            self._sd_stream = None
+
         if self.output_stream:
             self.output_stream.stop_stream()
             self.output_stream.close()